@@ -1,62 +1,337 @@
 #!/usr/bin/env python3
 import sqlite3
+import atexit
 import logging
-from flask import Flask, request, jsonify
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from operator import itemgetter
+import fastjsonschema
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
 
 # Configure Logging
+# Request threads only enqueue records; a background listener owns the actual
+# I/O, and file writes are batched until 1024 records or an ERROR arrives.
+_log_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+_file_handler = logging.FileHandler("app.log")
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_memory_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_file_handler)
+
+# The listener's handlers apply the real format; the queue side only merges args into the message
+_queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = None
+
+def _start_log_listener():
+    """
+    Start the thread that drains the log queue into the file and stream handlers.
+    """
+    global _log_listener
+    _log_listener = logging.handlers.QueueListener(_queue_handler.queue, _memory_handler, _stream_handler)
+    _log_listener.start()
+
+def _restart_log_listener_in_child():
+    """
+    Forked children don't inherit the listener thread, so give them their own.
+    Records queued or buffered before the fork belong to the parent and are dropped.
+    """
+    _queue_handler.queue = queue.SimpleQueue()
+    _memory_handler.buffer.clear()
+    _start_log_listener()
+
+_start_log_listener()
+atexit.register(lambda: _log_listener.stop())
+os.register_at_fork(after_in_child=_restart_log_listener_in_child)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[_queue_handler]
 )
 
 # Flask app setup
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024  # Bound request bodies; leaves room for bulk_add batches
 
 DATABASE = 'database.db'
+POOL_SIZE = 8
+CHECKPOINT_INTERVAL = 60  # Seconds between background WAL checkpoints
+
+# Statements are kept as module constants so SQLite's per-connection statement cache can reuse them
+_INSERT_SQL_NO_RETURNING = "INSERT INTO users (name, email, phone, address, country) VALUES (?, ?, ?, ?, ?)"
+_INSERT_SQL = _INSERT_SQL_NO_RETURNING + " RETURNING *"
+_UPDATE_SQL = """
+    UPDATE users
+    SET name = ?, email = ?, phone = ?, address = ?, country = ?
+    WHERE user_id = ?
+    RETURNING *
+"""
+_USER_FIELDS = itemgetter('name', 'email', 'phone', 'address', 'country')
+
+# Request payload schemas, compiled once into Python validators at import time
+_REQUIRED_ADD = frozenset(('name', 'email', 'phone', 'address', 'country'))
+_REQUIRED_UPDATE = _REQUIRED_ADD | {'user_id'}
+_USER_PROPERTIES = {
+    "name": {"type": "string"},
+    "email": {"type": "string"},
+    "phone": {"type": ["string", "integer"]},
+    "address": {"type": "string"},
+    "country": {"type": "string"},
+}
+_USER_SCHEMA = {
+    "type": "object",
+    "required": sorted(_REQUIRED_ADD),
+    "properties": _USER_PROPERTIES,
+}
+validate_add_user = fastjsonschema.compile(_USER_SCHEMA)
+validate_update_user = fastjsonschema.compile({
+    "type": "object",
+    "required": sorted(_REQUIRED_UPDATE),
+    "properties": {"user_id": {"type": "integer"}, **_USER_PROPERTIES},
+})
+validate_bulk_users = fastjsonschema.compile({"type": "array", "items": _USER_SCHEMA})
+
+def validation_error(e, obj, required):
+    """
+    Build the error message for a failed payload validation.
+    Missing fields are listed by name; the set difference only runs on failure.
+    Args:
+        e (fastjsonschema.JsonSchemaValueException): Validation failure.
+        obj: The validated payload.
+        required (frozenset): Fields the payload must contain.
+    Returns:
+        str: Error message.
+    """
+    if e.rule == "required" and isinstance(obj, dict):
+        return f"Missing fields: {', '.join(sorted(required - obj.keys()))}"
+    return e.message
 
-def connect_to_db():
+def connect_to_db(read_only=False):
     """
     Establish a connection to the SQLite database.
+    Connections run in autocommit mode; writers open transactions explicitly.
+    Args:
+        read_only (bool): Open the database read-only instead of read-write.
     Returns:
         sqlite3.Connection: Database connection object.
     """
     try:
-        conn = sqlite3.connect(DATABASE)
-        conn.row_factory = sqlite3.Row  # Enable accessing columns by name
+        mode = "ro" if read_only else "rwc"
+        # Pooled connections are handed between Flask worker threads
+        conn = sqlite3.connect(
+            f"file:{DATABASE}?mode={mode}", uri=True,
+            isolation_level=None, check_same_thread=False
+        )
+        # Per-connection tuning; journal_mode=WAL is persistent and set in create_db_table()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA mmap_size=268435456")  # Read pages via a 256 MiB mmap instead of pread()
+        conn.execute("PRAGMA journal_size_limit=67108864")  # Trim the WAL file to 64 MiB when it is reset
         return conn
     except sqlite3.Error as e:
         logging.error(f"Database connection failed: {e}")
         return None
 
+def fetch_dicts(cursor):
+    """
+    Fetch all remaining rows from a cursor as dictionaries.
+    Column names are read once per result set instead of once per row.
+    Args:
+        cursor (sqlite3.Cursor): Cursor holding an executed query.
+    Returns:
+        list: List of row dictionaries keyed by column name.
+    """
+    columns = tuple(column[0] for column in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+class ConnectionPool:
+    """
+    Fixed-size pool of SQLite connections shared across request threads.
+    Reusing connections keeps SQLite's page cache warm and avoids reopening
+    the database (and its -wal/-shm files) on every request. Connections are
+    opened lazily, so each WSGI worker process opens its own.
+    """
+
+    def __init__(self, size, read_only=False, timeout=30):
+        self.size = size
+        self.read_only = read_only
+        self.timeout = timeout
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all pooled connections without closing them.
+        Used in forked children, which must not touch the parent's SQLite handles.
+        """
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._connections = queue.Queue(maxsize=self.size)
+
+    def _get(self):
+        """
+        Take an idle connection, open a new one while below `size`, or wait for one.
+        Returns:
+            sqlite3.Connection: Connection, or None if none could be obtained.
+        """
+        try:
+            return self._connections.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_open = self._opened < self.size
+            if can_open:
+                self._opened += 1
+        if can_open:
+            conn = connect_to_db(read_only=self.read_only)
+            if conn is None:
+                with self._lock:
+                    self._opened -= 1
+            return conn
+        try:
+            return self._connections.get(timeout=self.timeout)
+        except queue.Empty:
+            logging.error("Timed out waiting for a pooled database connection.")
+            return None
+
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a connection from the pool for the duration of a `with` block.
+        Yields:
+            sqlite3.Connection: Pooled connection.
+        Raises:
+            ConnectionError: If no connection could be opened or became available.
+        """
+        conn = self._get()
+        if conn is None:
+            raise ConnectionError("No database connection available.")
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            # Never hand an open transaction (and its locks) to the next borrower
+            if conn.in_transaction:
+                conn.rollback()
+            self._connections.put(conn)
+
+# SQLite allows one writer at a time, so writes go through a single connection
+# while reads use their own read-only connections and never queue behind a writer
+read_pool = ConnectionPool(POOL_SIZE, read_only=True)
+write_pool = ConnectionPool(1)
+os.register_at_fork(after_in_child=read_pool.reset)
+os.register_at_fork(after_in_child=write_pool.reset)
+
+# Serialized GET responses, valid only for the data version they were built from.
+# The version lives in the database so a write in any worker process invalidates
+# the caches of all of them.
+RESPONSE_CACHE_SIZE = 1024
+_response_cache = {}
+_cache_lock = threading.Lock()
+_cached_version = None
+
+def bump_data_version(conn):
+    """
+    Advance the shared data version inside the caller's write transaction.
+    
+    Args:
+        conn (sqlite3.Connection): Write connection with an open transaction.
+    """
+    conn.execute("UPDATE meta SET data_version = data_version + 1 WHERE id = 0")
+
+def get_data_version():
+    """
+    Read the shared data version, qualified with the database instance.
+    
+    Returns:
+        str: Version stamp such as "3fa2c1d0-42", or None if it could not be read.
+    """
+    with read_pool.acquire() as conn:
+        try:
+            instance, version = conn.execute("SELECT instance, data_version FROM meta WHERE id = 0").fetchone()
+            return f"{instance}-{version}"
+        except (sqlite3.Error, TypeError) as e:
+            logging.error(f"Error fetching data version: {e}")
+            return None
+
+def cached_json(key, version, build):
+    """
+    Return the cached JSON payload for `key` at `version`, building it on a miss.
+    
+    Args:
+        key (tuple): Cache key.
+        version (str): Data version read before building; None disables caching.
+        build (callable): Returns the serialized payload, or None if there is nothing to cache.
+    
+    Returns:
+        bytes: JSON payload, or None if `build` produced nothing.
+    """
+    global _cached_version
+    if version is None:
+        return build()
+    with _cache_lock:
+        payload = _response_cache.get((key, version))
+    if payload is not None:
+        return payload
+    # Built after `version` was read, so the payload is never older than its version
+    payload = build()
+    with _cache_lock:
+        if payload is not None:
+            if version != _cached_version or len(_response_cache) >= RESPONSE_CACHE_SIZE:
+                _response_cache.clear()
+                _cached_version = version
+            _response_cache[(key, version)] = payload
+    return payload
+
+_db_initialized = False
+_db_init_lock = threading.Lock()
+
 def create_db_table():
     """
     Create the 'users' table in the SQLite database if it doesn't exist.
     """
-    with connect_to_db() as conn:
-        if conn:
-            try:
-                conn.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT NOT NULL UNIQUE,
-                    phone TEXT NOT NULL,
-                    address TEXT NOT NULL,
-                    country TEXT NOT NULL
-                );
-                ''')
-                conn.commit()
-                logging.info("User table ensured in database.")
-            except sqlite3.Error as e:
-                logging.error(f"Failed to create users table: {e}")
-        else:
-            logging.error("No database connection available to create table.")
+    global _db_initialized
+    with write_pool.acquire() as conn:
+        try:
+            # WAL lets readers run concurrently with a writer; the mode is stored in the file
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                user_id INTEGER PRIMARY KEY NOT NULL,
+                name TEXT NOT NULL,
+                email TEXT NOT NULL UNIQUE,  -- UNIQUE already maintains an index on email
+                phone TEXT NOT NULL,
+                address TEXT NOT NULL,
+                country TEXT NOT NULL
+            );
+            ''')
+            # Single-row table holding the data version shared by all worker processes.
+            # `instance` is random per database file, so versions of a recreated
+            # database never collide with ETags issued for the old one.
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS meta (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                instance TEXT NOT NULL,
+                data_version INTEGER NOT NULL
+            );
+            ''')
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (id, instance, data_version) VALUES (0, lower(hex(randomblob(4))), 0)"
+            )
+            _db_initialized = True
+            logging.info("User table ensured in database.")
+        except sqlite3.Error as e:
+            logging.error(f"Failed to create users table: {e}")
 
 def insert_user(user):
     """
@@ -68,26 +343,49 @@ def insert_user(user):
     Returns:
         dict: Inserted user details or empty dict on failure.
     """
-    with connect_to_db() as conn:
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO users (name, email, phone, address, country) VALUES (?, ?, ?, ?, ?)",
-                    (user['name'], user['email'], user['phone'], user['address'], user['country'])
-                )
-                conn.commit()
-                user_id = cursor.lastrowid
-                logging.info(f"Inserted user with ID: {user_id}")
-                return get_user_by_id(user_id)
-            except sqlite3.IntegrityError as e:
-                logging.error(f"Integrity Error inserting user: {e}")
-                return {"error": "Email must be unique."}
-            except sqlite3.Error as e:
-                logging.error(f"Error inserting user: {e}")
-                return {"error": "Failed to insert user."}
-        else:
-            return {"error": "Database connection failed."}
+    with write_pool.acquire() as conn:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            cursor.execute(_INSERT_SQL, _USER_FIELDS(user))
+            # Drain RETURNING fully; COMMIT fails while the statement is still in progress
+            inserted = fetch_dicts(cursor)[0]
+            bump_data_version(conn)
+            conn.execute("COMMIT")
+            logging.info(f"Inserted user with ID: {inserted['user_id']}")
+            return inserted
+        except sqlite3.IntegrityError as e:
+            logging.error(f"Integrity Error inserting user: {e}")
+            return {"error": "Email must be unique."}
+        except sqlite3.Error as e:
+            logging.error(f"Error inserting user: {e}")
+            return {"error": "Failed to insert user."}
+
+def insert_users_bulk(users):
+    """
+    Insert many users in a single transaction, so the batch shares one commit.
+    
+    Args:
+        users (list): List of user dictionaries.
+    
+    Returns:
+        dict: Number of inserted users, or an error message on failure.
+    """
+    with write_pool.acquire() as conn:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            cursor.executemany(_INSERT_SQL_NO_RETURNING, [_USER_FIELDS(user) for user in users])
+            bump_data_version(conn)
+            conn.execute("COMMIT")
+            logging.info(f"Bulk inserted {len(users)} users.")
+            return {"inserted": len(users)}
+        except sqlite3.IntegrityError as e:
+            logging.error(f"Integrity Error bulk inserting users: {e}")
+            return {"error": "Email must be unique."}
+        except sqlite3.Error as e:
+            logging.error(f"Error bulk inserting users: {e}")
+            return {"error": "Failed to insert users."}
 
 def get_users():
     """
@@ -96,20 +394,15 @@ def get_users():
     Returns:
         list: List of user dictionaries.
     """
-    with connect_to_db() as conn:
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM users")
-                rows = cursor.fetchall()
-                users = [dict(row) for row in rows]
-                logging.info(f"Fetched {len(users)} users from database.")
-                return users
-            except sqlite3.Error as e:
-                logging.error(f"Error fetching users: {e}")
-                return []
-        else:
-            logging.error("Database connection failed when fetching users.")
+    with read_pool.acquire() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM users")
+            users = fetch_dicts(cursor)
+            logging.info(f"Fetched {len(users)} users from database.")
+            return users
+        except sqlite3.Error as e:
+            logging.error(f"Error fetching users: {e}")
             return []
 
 def get_user_by_id(user_id):
@@ -122,24 +415,20 @@ def get_user_by_id(user_id):
     Returns:
         dict: User details or empty dict if not found.
     """
-    with connect_to_db() as conn:
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-                row = cursor.fetchone()
-                if row:
-                    user = dict(row)
-                    logging.info(f"Fetched user with ID: {user_id}")
-                    return user
-                else:
-                    logging.warning(f"No user found with ID: {user_id}")
-                    return {}
-            except sqlite3.Error as e:
-                logging.error(f"Error fetching user by ID: {e}")
+    with read_pool.acquire() as conn:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
+            rows = fetch_dicts(cursor)
+            if rows:
+                user = rows[0]
+                logging.info(f"Fetched user with ID: {user_id}")
+                return user
+            else:
+                logging.warning(f"No user found with ID: {user_id}")
                 return {}
-        else:
-            logging.error("Database connection failed when fetching user by ID.")
+        except sqlite3.Error as e:
+            logging.error(f"Error fetching user by ID: {e}")
             return {}
 
 def update_user(user):
@@ -152,32 +441,26 @@ def update_user(user):
     Returns:
         dict: Updated user details or empty dict on failure.
     """
-    with connect_to_db() as conn:
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    UPDATE users
-                    SET name = ?, email = ?, phone = ?, address = ?, country = ?
-                    WHERE user_id = ?
-                    """,
-                    (user['name'], user['email'], user['phone'], user['address'], user['country'], user['user_id'])
-                )
-                conn.commit()
-                if cursor.rowcount == 0:
-                    logging.warning(f"No user found to update with ID: {user['user_id']}")
-                    return {"error": "User not found."}
-                logging.info(f"Updated user with ID: {user['user_id']}")
-                return get_user_by_id(user['user_id'])
-            except sqlite3.IntegrityError as e:
-                logging.error(f"Integrity Error updating user: {e}")
-                return {"error": "Email must be unique."}
-            except sqlite3.Error as e:
-                logging.error(f"Error updating user: {e}")
-                return {"error": "Failed to update user."}
-        else:
-            return {"error": "Database connection failed."}
+    with write_pool.acquire() as conn:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            cursor.execute(_UPDATE_SQL, _USER_FIELDS(user) + (user['user_id'],))
+            rows = fetch_dicts(cursor)
+            if rows:
+                bump_data_version(conn)
+            conn.execute("COMMIT")
+            if not rows:
+                logging.warning(f"No user found to update with ID: {user['user_id']}")
+                return {"error": "User not found."}
+            logging.info(f"Updated user with ID: {user['user_id']}")
+            return rows[0]
+        except sqlite3.IntegrityError as e:
+            logging.error(f"Integrity Error updating user: {e}")
+            return {"error": "Email must be unique."}
+        except sqlite3.Error as e:
+            logging.error(f"Error updating user: {e}")
+            return {"error": "Failed to update user."}
 
 def delete_user(user_id):
     """
@@ -189,88 +472,220 @@ def delete_user(user_id):
     Returns:
         dict: Status message.
     """
-    with connect_to_db() as conn:
-        if conn:
-            try:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
-                conn.commit()
-                if cursor.rowcount == 0:
-                    logging.warning(f"No user found to delete with ID: {user_id}")
-                    return {"status": "User not found."}
-                logging.info(f"Deleted user with ID: {user_id}")
-                return {"status": "User deleted successfully."}
-            except sqlite3.Error as e:
-                logging.error(f"Error deleting user: {e}")
-                return {"status": "Failed to delete user."}
-        else:
-            return {"status": "Database connection failed."}
-
-# Initialize the database table
-create_db_table()
+    with write_pool.acquire() as conn:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+            if cursor.rowcount:
+                bump_data_version(conn)
+            conn.execute("COMMIT")
+            if cursor.rowcount == 0:
+                logging.warning(f"No user found to delete with ID: {user_id}")
+                return {"status": "User not found."}
+            logging.info(f"Deleted user with ID: {user_id}")
+            return {"status": "User deleted successfully."}
+        except sqlite3.Error as e:
+            logging.error(f"Error deleting user: {e}")
+            return {"status": "Failed to delete user."}
+
+def checkpoint_wal():
+    """
+    Copy committed WAL frames back into the database file.
+    With synchronous=NORMAL commits skip fsync; checkpoints are where data is synced.
+    PASSIVE mode never waits on readers or writers, and the checkpoint runs on its
+    own short-lived connection, so the write pool stays free for requests.
+    """
+    conn = connect_to_db()
+    if conn is None:
+        raise ConnectionError("No database connection available.")
+    try:
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    except sqlite3.Error as e:
+        logging.error(f"WAL checkpoint failed: {e}")
+    finally:
+        conn.close()
+
+def _checkpoint_loop():
+    while True:
+        time.sleep(CHECKPOINT_INTERVAL)
+        try:
+            checkpoint_wal()
+        except ConnectionError as e:
+            logging.error(f"Skipping WAL checkpoint: {e}")
+
+def start_wal_checkpointer():
+    """
+    Start the daemon thread that checkpoints the WAL every CHECKPOINT_INTERVAL seconds.
+    """
+    threading.Thread(target=_checkpoint_loop, name="wal-checkpoint", daemon=True).start()
+
+# Initialize the database table on first use rather than at import, so
+# reloader restarts and WSGI workers don't each open the database up front
+@app.before_request
+def ensure_db_table():
+    if not _db_initialized:
+        with _db_init_lock:
+            if not _db_initialized:
+                create_db_table()
+                # Started here, not at import, so each worker process runs its own thread
+                if _db_initialized:
+                    start_wal_checkpointer()
+
+@app.cli.command("init-db")
+def init_db_command():
+    """Create the users table (flask --app app init-db)."""
+    create_db_table()
+
+def json_response(obj, status=200):
+    """
+    Serialize `obj` with orjson into a JSON response.
+    
+    Args:
+        obj: JSON-serializable object.
+        status (int): HTTP status code.
+    
+    Returns:
+        flask.Response: Response carrying the encoded body.
+    """
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def cached_json_response(key, build, etag_suffix=""):
+    """
+    Serve a cached GET payload, answering 304 when the client's copy is current.
+    
+    Args:
+        key (tuple): Cache key passed to cached_json().
+        build (callable): Builds the payload on a cache miss.
+        etag_suffix (str): Appended to the data version to form the weak ETag.
+    
+    Returns:
+        flask.Response: 200 or 304 response, or None if `build` produced nothing.
+    """
+    version = get_data_version()
+    etag = None if version is None else f"{version}{etag_suffix}"
+    if etag and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        payload = cached_json(key, version, build)
+        if payload is None:
+            return None
+        response = Response(payload, status=200, mimetype='application/json')
+    if etag:
+        response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "max-age=0, must-revalidate"
+    return response
 
 # API Endpoints
+@app.errorhandler(ConnectionError)
+def handle_connection_error(e):
+    logging.error(f"Database connection failed: {e}")
+    return json_response({"error": "Database connection failed."}, 503)
+
+@app.errorhandler(413)
+def handle_request_too_large(e):
+    logging.warning("Request body exceeded MAX_CONTENT_LENGTH.")
+    return json_response({"error": "Request body too large."}, 413)
+
 @app.route('/api/users', methods=['GET'])
 def api_get_users():
-    users = get_users()
-    return jsonify(users), 200
+    return cached_json_response(("users",), lambda: orjson.dumps(get_users()))
 
 @app.route('/api/users/<int:user_id>', methods=['GET'])
 def api_get_user(user_id):
-    user = get_user_by_id(user_id)
-    if user:
-        return jsonify(user), 200
+    def build():
+        user = get_user_by_id(user_id)
+        return orjson.dumps(user) if user else None
+
+    response = cached_json_response(("user", user_id), build, etag_suffix=f"-{user_id}")
+    if response:
+        return response
     else:
-        return jsonify({"error": "User not found."}), 404
+        return json_response({"error": "User not found."}, 404)
 
 @app.route('/api/users/add', methods=['POST'])
 def api_add_user():
-    user = request.get_json()
-    required_fields = ['name', 'email', 'phone', 'address', 'country']
+    try:
+        user = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        logging.warning("Invalid JSON provided for adding user.")
+        return json_response({"error": "Invalid JSON."}, 400)
     
     # Validate input
     if not user:
         logging.warning("No input data provided for adding user.")
-        return jsonify({"error": "No input data provided."}), 400
-    if not all(field in user for field in required_fields):
-        missing = [field for field in required_fields if field not in user]
-        logging.warning(f"Missing fields for adding user: {missing}")
-        return jsonify({"error": f"Missing fields: {', '.join(missing)}"}), 400
+        return json_response({"error": "No input data provided."}, 400)
+    try:
+        validate_add_user(user)
+    except fastjsonschema.JsonSchemaValueException as e:
+        error = validation_error(e, user, _REQUIRED_ADD)
+        logging.warning(f"Invalid data for adding user: {error}")
+        return json_response({"error": error}, 400)
     
     inserted_user = insert_user(user)
     if "error" in inserted_user:
-        return jsonify(inserted_user), 400
-    return jsonify(inserted_user), 201
+        return json_response(inserted_user, 400)
+    return json_response(inserted_user, 201)
+
+@app.route('/api/users/bulk_add', methods=['POST'])
+def api_bulk_add_users():
+    try:
+        users = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        logging.warning("Invalid JSON provided for bulk adding users.")
+        return json_response({"error": "Invalid JSON."}, 400)
+    
+    # Validate input
+    if not users:
+        logging.warning("No input data provided for bulk adding users.")
+        return json_response({"error": "No input data provided."}, 400)
+    try:
+        validate_bulk_users(users)
+    except fastjsonschema.JsonSchemaValueException as e:
+        logging.warning(f"Invalid data for bulk adding users: {e.message}")
+        return json_response({"error": e.message}, 400)
+    
+    result = insert_users_bulk(users)
+    if "error" in result:
+        return json_response(result, 400)
+    return json_response(result, 201)
 
 @app.route('/api/users/update', methods=['PUT'])
 def api_update_user():
-    user = request.get_json()
-    required_fields = ['user_id', 'name', 'email', 'phone', 'address', 'country']
+    try:
+        user = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        logging.warning("Invalid JSON provided for updating user.")
+        return json_response({"error": "Invalid JSON."}, 400)
     
     # Validate input
     if not user:
         logging.warning("No input data provided for updating user.")
-        return jsonify({"error": "No input data provided."}), 400
-    if not all(field in user for field in required_fields):
-        missing = [field for field in required_fields if field not in user]
-        logging.warning(f"Missing fields for updating user: {missing}")
-        return jsonify({"error": f"Missing fields: {', '.join(missing)}"}), 400
+        return json_response({"error": "No input data provided."}, 400)
+    try:
+        validate_update_user(user)
+    except fastjsonschema.JsonSchemaValueException as e:
+        error = validation_error(e, user, _REQUIRED_UPDATE)
+        logging.warning(f"Invalid data for updating user: {error}")
+        return json_response({"error": error}, 400)
     
     updated_user = update_user(user)
     if "error" in updated_user:
-        return jsonify(updated_user), 400
-    return jsonify(updated_user), 200
+        return json_response(updated_user, 400)
+    return json_response(updated_user, 200)
 
 @app.route('/api/users/delete/<int:user_id>', methods=['DELETE'])
 def api_delete_user(user_id):
     result = delete_user(user_id)
     if result.get("status") == "User deleted successfully.":
-        return jsonify(result), 200
+        return json_response(result, 200)
     elif result.get("status") == "User not found.":
-        return jsonify(result), 404
+        return json_response(result, 404)
     else:
-        return jsonify(result), 400
+        return json_response(result, 400)
 
 # Run the Flask app
+# Development server only. In production, serve through a WSGI server, e.g.:
+#   gunicorn -k gthread --threads 16 -w $(nproc) app:app
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run(host="0.0.0.0", debug=False, threaded=True)